@@ -3,5 +3,6 @@
 from .aes import AES
 from .blowfish import Blowfish
 from .twofish import Twofish
+from .threadsafe import ThreadSafeCipher
 
-__all__ = ['AES', 'Blowfish', 'Twofish']
\ No newline at end of file
+__all__ = ['AES', 'Blowfish', 'Twofish', 'ThreadSafeCipher']
\ No newline at end of file
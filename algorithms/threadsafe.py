@@ -0,0 +1,51 @@
+import threading
+
+
+class ThreadSafeCipher:
+
+    def __init__(self, algorithm_class, key_size=256):
+        self.algorithm_class = algorithm_class
+        self.key_size = key_size
+        self._state = (None, 0)
+        self._state_lock = threading.Lock()
+        self._local = threading.local()
+
+        # Valida o tamanho da chave na criação, não na primeira thread
+        algorithm_class(key_size=key_size)
+
+    @property
+    def key(self):
+        return self._state[0]
+
+    def generate_key(self):
+        instance = self.algorithm_class(key_size=self.key_size)
+        self.set_key(instance.generate_key())
+        return self.key
+
+    def set_key(self, key):
+        self.algorithm_class(key_size=self.key_size).set_key(key)
+
+        # Chave e versão publicadas juntas numa única tupla imutável
+        with self._state_lock:
+            self._state = (key, self._state[1] + 1)
+
+    def encrypt(self, plaintext):
+        return self._get_instance().encrypt(plaintext)
+
+    def decrypt(self, iv, ciphertext):
+        return self._get_instance().decrypt(iv, ciphertext)
+
+    def _get_instance(self):
+        key, version = self._state
+        if key is None:
+            raise ValueError("Chave não definida. Use generate_key() ou set_key()")
+
+        # Cada thread mantém seu próprio contexto (ex.: Crypt2 do Twofish com IV mutável)
+        local = self._local
+        if getattr(local, 'key_version', None) != version:
+            if getattr(local, 'instance', None) is None:
+                local.instance = self.algorithm_class(key_size=self.key_size)
+            local.instance.set_key(key)
+            local.key_version = version
+
+        return local.instance
@@ -72,7 +72,8 @@ def create_cpu_usage_chart(results):
         cpu_values = []
         for result in alg['results']:
             cpu_values.extend(result['cpu_usage'])
-        cpu_avg = np.mean([x for x in cpu_values if x > 0]) if any(x > 0 for x in cpu_values) else 0
+        cpu_samples = [x for x in cpu_values if x is not None and x > 0]
+        cpu_avg = np.mean(cpu_samples) if cpu_samples else 0
         cpu_averages.append(cpu_avg)
     
     colors = plt.cm.Set3(np.linspace(0, 1, len(alg_names)))
@@ -94,7 +95,7 @@ def create_cpu_usage_chart(results):
         time_vals = []
         for result in alg['results']:
             for j, cpu in enumerate(result['cpu_usage']):
-                if cpu > 0:
+                if cpu is not None and cpu > 0:
                     cpu_vals.append(cpu)
                     time_vals.append(result['encryption_times'][j] * 1000)
         
@@ -130,7 +131,8 @@ def create_efficiency_chart(results):
         throughputs.append(throughput)
         
         # Uso médio de memória
-        avg_memory = np.mean(largest_result['memory_usage'])
+        memory_samples = [x for x in largest_result['memory_usage'] if x is not None]
+        avg_memory = np.mean(memory_samples) if memory_samples else 0
         memory_usage.append(avg_memory / 1024)  # MB
     
     # Gráfico de throughput
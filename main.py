@@ -15,6 +15,14 @@ def main():
         data_sizes=data_sizes,
         iterations=iterations
     )
+    results['workloads'] = suite.run_workload_benchmarks(
+        data_size=10240,
+        operations=200
+    )
+    results['concurrency'] = suite.run_concurrency_benchmarks(
+        thread_counts=[1, 2, 4, 8],
+        operations_per_thread=50
+    )
 
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     output_file = f"results/benchmark_results_{timestamp}.json"
@@ -1,11 +1,21 @@
 
 import os
+import random
+import threading
 import time
 import statistics
 from .monitor import PerformanceMonitor, BenchmarkTimer
 from algorithms.aes import AES
 from algorithms.blowfish import Blowfish
 from algorithms.twofish import Twofish
+from algorithms.threadsafe import ThreadSafeCipher
+
+
+WORKLOAD_PROFILES = {
+    'read_heavy': {'decrypt_ratio': 0.9, 'num_keys': 1},
+    'write_heavy': {'decrypt_ratio': 0.1, 'num_keys': 1},
+    'mixed': {'decrypt_ratio': 0.5, 'num_keys': 4}
+}
 
 
 class BenchmarkSuite:
@@ -27,32 +37,56 @@ class BenchmarkSuite:
                 'encryption_times': [],
                 'decryption_times': [],
                 'cpu_usage': [],
-                'memory_usage': []
+                'memory_usage': [],
+                'decrypt_cpu_usage': [],
+                'decrypt_memory_usage': [],
+                'rejected_runs': [],
+                'missing_samples': 0
             }
 
             for i in range(iterations):
                 test_data = self._generate_test_data(size)
 
-                encrypt_result = self._benchmark_operation(
-                    lambda: algorithm.encrypt(test_data),
-                    f"encrypt_{i}"
-                )
+                try:
+                    encrypt_result = self._benchmark_operation(
+                        lambda: algorithm.encrypt(test_data)
+                    )
 
-                iv, ciphertext = encrypt_result[0]
-                decrypt_result = self._benchmark_operation(
-                    lambda: algorithm.decrypt(iv, ciphertext),
-                    f"decrypt_{i}"
-                )
+                    iv, ciphertext = encrypt_result[0]
+                    decrypt_result = self._benchmark_operation(
+                        lambda: algorithm.decrypt(iv, ciphertext)
+                    )
+                except Exception as e:
+                    size_results['rejected_runs'].append(f"{i}: {e}")
+                    continue
+
+                # Validação fora da região cronometrada
+                if decrypt_result[0] != test_data:
+                    size_results['rejected_runs'].append(f"{i}: round-trip inválido")
+                    continue
 
                 size_results['encryption_times'].append(encrypt_result[1])
                 size_results['decryption_times'].append(decrypt_result[1])
-                size_results['cpu_usage'].append(encrypt_result[2]['cpu']['mean'])
-                size_results['memory_usage'].append(encrypt_result[2]['memory']['mean'])
+                size_results['cpu_usage'].append(self._stat_mean(encrypt_result[2], 'cpu'))
+                size_results['memory_usage'].append(self._stat_mean(encrypt_result[2], 'memory'))
+                size_results['decrypt_cpu_usage'].append(self._stat_mean(decrypt_result[2], 'cpu'))
+                size_results['decrypt_memory_usage'].append(self._stat_mean(decrypt_result[2], 'memory'))
+                size_results['missing_samples'] += sum(
+                    1 for op_result in (encrypt_result, decrypt_result) if not op_result[2]
+                )
+
+            if not size_results['encryption_times']:
+                raise RuntimeError(
+                    f"Todas as execuções de {results['algorithm']} com {size} bytes foram rejeitadas: "
+                    f"{size_results['rejected_runs']}"
+                )
 
             size_results['avg_encrypt_time'] = statistics.mean(size_results['encryption_times'])
             size_results['avg_decrypt_time'] = statistics.mean(size_results['decryption_times'])
-            size_results['avg_cpu_usage'] = statistics.mean(size_results['cpu_usage'])
-            size_results['avg_memory_usage'] = statistics.mean(size_results['memory_usage'])
+            size_results['avg_cpu_usage'] = self._sample_mean(size_results['cpu_usage'])
+            size_results['avg_memory_usage'] = self._sample_mean(size_results['memory_usage'])
+            size_results['avg_decrypt_cpu_usage'] = self._sample_mean(size_results['decrypt_cpu_usage'])
+            size_results['avg_decrypt_memory_usage'] = self._sample_mean(size_results['decrypt_memory_usage'])
 
             results['results'].append(size_results)
 
@@ -120,19 +154,288 @@ class BenchmarkSuite:
 
         return results
 
-    def _benchmark_operation(self, operation, operation_name):
-        self.monitor.start_monitoring()
+    def run_workload_benchmark(self, algorithm_class, key_size, profile,
+                               data_size=10240, operations=100, corpus_size=16, seed=None):
+        if profile not in WORKLOAD_PROFILES:
+            raise ValueError(f"Perfil de carga desconhecido: {profile}")
+
+        decrypt_ratio = WORKLOAD_PROFILES[profile]['decrypt_ratio']
+        num_keys = WORKLOAD_PROFILES[profile]['num_keys']
+        rng = random.Random(seed)
+
+        instances = []
+        for _ in range(num_keys):
+            algorithm = algorithm_class(key_size=key_size)
+            algorithm.generate_key()
+            instances.append(algorithm)
+
+        corpus = self._build_corpus(instances, data_size, corpus_size)
+
+        results = {
+            'algorithm': algorithm_class.__name__,
+            'key_size': key_size,
+            'profile': profile,
+            'decrypt_ratio': decrypt_ratio,
+            'num_keys': num_keys,
+            'data_size': data_size,
+            'operations': operations,
+            'encrypt': self._empty_direction_results(),
+            'decrypt': self._empty_direction_results(),
+            'rejected_runs': []
+        }
+
+        for i in range(operations):
+            algorithm, plaintext, iv, ciphertext = rng.choice(corpus)
+            direction = 'decrypt' if rng.random() < decrypt_ratio else 'encrypt'
+
+            try:
+                if direction == 'decrypt':
+                    op_result = self._benchmark_operation(
+                        lambda: algorithm.decrypt(iv, ciphertext)
+                    )
+                    valid = op_result[0] == plaintext
+                else:
+                    op_result = self._benchmark_operation(
+                        lambda: algorithm.encrypt(plaintext)
+                    )
+                    new_iv, new_ciphertext = op_result[0]
+                    # Exceções na verificação caem no except abaixo com a causa registrada
+                    valid = algorithm.decrypt(new_iv, new_ciphertext) == plaintext
+            except Exception as e:
+                results['rejected_runs'].append(f"{direction}_{i}: {e}")
+                continue
+
+            if not valid:
+                results['rejected_runs'].append(f"{direction}_{i}: round-trip inválido")
+                continue
+
+            direction_results = results[direction]
+            direction_results['times'].append(op_result[1])
+            direction_results['cpu_usage'].append(self._stat_mean(op_result[2], 'cpu'))
+            direction_results['memory_usage'].append(self._stat_mean(op_result[2], 'memory'))
+            if not op_result[2]:
+                direction_results['missing_samples'] += 1
+
+        for direction in ('encrypt', 'decrypt'):
+            self._summarize_direction(results[direction])
+
+        results['valid_operations'] = results['encrypt']['count'] + results['decrypt']['count']
+        return results
+
+    def run_workload_benchmarks(self, data_size=10240, operations=100, corpus_size=16, seed=None):
+        results = {
+            'timestamp': time.time(),
+            'data_size': data_size,
+            'operations': operations,
+            'corpus_size': corpus_size,
+            'workloads': []
+        }
+
+        configs = [
+            {'name': 'AES-256', 'class': AES, 'key_size': 256},
+            {'name': 'Blowfish-128', 'class': Blowfish, 'key_size': 128},
+            {'name': 'Twofish-256', 'class': Twofish, 'key_size': 256}
+        ]
+
+        for config in configs:
+            for profile in WORKLOAD_PROFILES:
+                workload_result = self.run_workload_benchmark(
+                    config['class'], config['key_size'], profile,
+                    data_size=data_size, operations=operations,
+                    corpus_size=corpus_size, seed=seed
+                )
+                workload_result['name'] = config['name']
+                results['workloads'].append(workload_result)
+
+        return results
+
+    def run_concurrency_benchmark(self, algorithm_class, key_size, thread_counts=None,
+                                  operations_per_thread=50, data_size=10240):
+        if thread_counts is None:
+            thread_counts = [1, 2, 4, 8]
+
+        # A escalabilidade é sempre relativa a uma execução com 1 thread
+        thread_counts = sorted(set(thread_counts) | {1})
+
+        results = {
+            'algorithm': algorithm_class.__name__,
+            'key_size': key_size,
+            'data_size': data_size,
+            'operations_per_thread': operations_per_thread,
+            'results': []
+        }
+
+        shared = algorithm_class(key_size=key_size)
+        key = shared.generate_key()
+        lock = threading.Lock()
+
+        facade = ThreadSafeCipher(algorithm_class, key_size=key_size)
+        facade.set_key(key)
+
+        for thread_count in thread_counts:
+            locked_result = self._run_concurrent_workers(
+                shared, thread_count, operations_per_thread, data_size, lock=lock
+            )
+            thread_local_result = self._run_concurrent_workers(
+                facade, thread_count, operations_per_thread, data_size
+            )
+            results['results'].append({
+                'threads': thread_count,
+                'locked_shared': locked_result,
+                'thread_local': thread_local_result
+            })
+
+        baseline = next(r for r in results['results'] if r['threads'] == 1)
+        for mode in ('locked_shared', 'thread_local'):
+            base_throughput = baseline[mode]['throughput']
+            for thread_result in results['results']:
+                mode_result = thread_result[mode]
+                mode_result['scaling'] = (
+                    mode_result['throughput'] / base_throughput
+                    if mode_result['throughput'] is not None and base_throughput else None
+                )
+
+        return results
+
+    def run_concurrency_benchmarks(self, thread_counts=None, operations_per_thread=50, data_size=10240):
+        results = {
+            'timestamp': time.time(),
+            'algorithms': []
+        }
+
+        configs = [
+            {'name': 'AES-256', 'class': AES, 'key_size': 256},
+            {'name': 'Blowfish-128', 'class': Blowfish, 'key_size': 128},
+            {'name': 'Twofish-256', 'class': Twofish, 'key_size': 256}
+        ]
+
+        for config in configs:
+            concurrency_result = self.run_concurrency_benchmark(
+                config['class'], config['key_size'], thread_counts=thread_counts,
+                operations_per_thread=operations_per_thread, data_size=data_size
+            )
+            concurrency_result['name'] = config['name']
+            results['algorithms'].append(concurrency_result)
+
+        return results
+
+    def _run_concurrent_workers(self, algorithm, thread_count, operations_per_thread,
+                                data_size, lock=None):
+        barrier = threading.Barrier(thread_count + 1)
+        counters_lock = threading.Lock()
+        counters = {'completed': 0, 'mismatches': 0, 'errors': []}
+
+        def round_trip(plaintext):
+            if lock is None:
+                iv, ciphertext = algorithm.encrypt(plaintext)
+                return algorithm.decrypt(iv, ciphertext)
+            with lock:
+                iv, ciphertext = algorithm.encrypt(plaintext)
+                return algorithm.decrypt(iv, ciphertext)
+
+        def worker():
+            payloads = [self._generate_test_data(data_size) for _ in range(operations_per_thread)]
+            completed = 0
+            mismatches = 0
+            errors = []
+
+            # Aquece o contexto da thread (ex.: Crypt2 por thread) fora da região cronometrada
+            try:
+                round_trip(self._generate_test_data(data_size))
+            except Exception as e:
+                errors.append(f"warm-up: {e}")
 
+            barrier.wait()
+            for plaintext in payloads:
+                try:
+                    if round_trip(plaintext) == plaintext:
+                        completed += 1
+                    else:
+                        mismatches += 1
+                except Exception as e:
+                    errors.append(str(e))
+
+            with counters_lock:
+                counters['completed'] += completed
+                counters['mismatches'] += mismatches
+                counters['errors'].extend(errors)
+
+        threads = [threading.Thread(target=worker) for _ in range(thread_count)]
+        for thread in threads:
+            thread.start()
+
+        barrier.wait()
         self.timer.start()
-        try:
-            result = operation()
-        except Exception as e:
-            print(f"Erro na operação {operation_name}: {e}")
-            result = None
+        for thread in threads:
+            thread.join()
         execution_time = self.timer.stop()
         self.timer.reset()
 
-        system_stats = self.monitor.stop_monitoring()
+        processed_bytes = counters['completed'] * data_size
+        valid = counters['mismatches'] == 0 and not counters['errors']
+        return {
+            'execution_time': execution_time,
+            'completed': counters['completed'],
+            'mismatches': counters['mismatches'],
+            'errors': counters['errors'],
+            'valid': valid,
+            'throughput': (
+                processed_bytes / execution_time if valid and execution_time > 0 else None
+            )
+        }
+
+    def _build_corpus(self, instances, data_size, corpus_size):
+        corpus = []
+        for i in range(corpus_size):
+            algorithm = instances[i % len(instances)]
+            plaintext = self._generate_test_data(data_size)
+            iv, ciphertext = algorithm.encrypt(plaintext)
+            if algorithm.decrypt(iv, ciphertext) != plaintext:
+                raise RuntimeError("Falha ao construir o corpus pré-criptografado")
+            corpus.append((algorithm, plaintext, iv, ciphertext))
+        return corpus
+
+    def _empty_direction_results(self):
+        return {
+            'times': [],
+            'cpu_usage': [],
+            'memory_usage': [],
+            'missing_samples': 0
+        }
+
+    def _summarize_direction(self, direction_results):
+        count = len(direction_results['times'])
+        direction_results['count'] = count
+        if count == 0:
+            direction_results['avg_time'] = None
+            direction_results['avg_cpu_usage'] = None
+            direction_results['avg_memory_usage'] = None
+            return
+
+        direction_results['avg_time'] = statistics.mean(direction_results['times'])
+        direction_results['avg_cpu_usage'] = self._sample_mean(direction_results['cpu_usage'])
+        direction_results['avg_memory_usage'] = self._sample_mean(direction_results['memory_usage'])
+
+    def _stat_mean(self, system_stats, resource):
+        # O monitor pode não ter coletado amostras em operações muito curtas
+        if not system_stats:
+            return None
+        return system_stats[resource]['mean']
+
+    def _sample_mean(self, values):
+        samples = [value for value in values if value is not None]
+        return statistics.mean(samples) if samples else None
+
+    def _benchmark_operation(self, operation):
+        self.monitor.start_monitoring()
+
+        self.timer.start()
+        try:
+            result = operation()
+            execution_time = self.timer.stop()
+        finally:
+            self.timer.reset()
+            system_stats = self.monitor.stop_monitoring()
 
         return result, execution_time, system_stats
 